@@ -0,0 +1,203 @@
+# cython: language_level=3
+"""Cython implementation of the ledger entry decoder used by ``PythonEntries``.
+
+Build the extension in place with ``cythonize -i _entries_decode.pyx``. When the
+compiled module is not available ``shredstream_client`` keeps using the pure
+Python decoder, which walks the exact same layout.
+"""
+
+cimport cython
+from libc.stdint cimport uint64_t
+
+
+cdef inline Py_ssize_t _advance(Py_ssize_t offset, Py_ssize_t length, Py_ssize_t total) except -1:
+    if length > total - offset:
+        raise ValueError("Unexpected end of buffer while decoding data")
+    return offset + length
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t _read_u64(
+    const unsigned char* data, Py_ssize_t offset, Py_ssize_t total, uint64_t* value
+) except -1:
+    cdef Py_ssize_t end = _advance(offset, 8, total)
+    cdef uint64_t result = 0
+    cdef int index
+
+    # Little-endian load, independent of the host byte order.
+    for index in range(7, -1, -1):
+        result = (result << 8) | data[offset + index]
+
+    value[0] = result
+    return end
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t _read_short_u16(
+    const unsigned char* data, Py_ssize_t offset, Py_ssize_t total, Py_ssize_t* value
+) except -1:
+    cdef Py_ssize_t result = 0
+    cdef int shift = 0
+    cdef unsigned char byte
+
+    while shift < 21:
+        if offset >= total:
+            raise ValueError("Unexpected end of buffer while decoding bytes")
+        byte = data[offset]
+        offset += 1
+        result |= (<Py_ssize_t>(byte & 0x7F)) << shift
+
+        if (byte & 0x80) == 0:
+            if result > 0xFFFF:
+                raise ValueError("Short vector length exceeds u16 range")
+            value[0] = result
+            return offset
+
+        shift += 7
+
+    raise ValueError("Short vector length uses more than three bytes")
+
+
+cdef Py_ssize_t _consume_compiled_instruction(
+    const unsigned char* data, Py_ssize_t offset, Py_ssize_t total
+) except -1:
+    cdef Py_ssize_t length
+
+    offset = _advance(offset, 1, total)  # program_id_index
+
+    offset = _read_short_u16(data, offset, total, &length)
+    offset = _advance(offset, length, total)
+
+    offset = _read_short_u16(data, offset, total, &length)
+    return _advance(offset, length, total)
+
+
+cdef Py_ssize_t _consume_message_body(
+    const unsigned char* data, Py_ssize_t offset, Py_ssize_t total, bint is_v0
+) except -1:
+    cdef Py_ssize_t length
+    cdef Py_ssize_t count
+    cdef Py_ssize_t index
+
+    # Header bytes left after the one already consumed by the caller.
+    offset = _advance(offset, 3 if is_v0 else 2, total)
+
+    offset = _read_short_u16(data, offset, total, &length)
+    offset = _advance(offset, 32 * length, total)
+
+    offset = _advance(offset, 32, total)  # recent_blockhash
+
+    offset = _read_short_u16(data, offset, total, &count)
+    for index in range(count):
+        offset = _consume_compiled_instruction(data, offset, total)
+
+    if not is_v0:
+        return offset
+
+    offset = _read_short_u16(data, offset, total, &count)
+    for index in range(count):
+        offset = _advance(offset, 32, total)  # account_key
+
+        offset = _read_short_u16(data, offset, total, &length)
+        offset = _advance(offset, length, total)
+
+        offset = _read_short_u16(data, offset, total, &length)
+        offset = _advance(offset, length, total)
+
+    return offset
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _consume_versioned_transaction(
+    const unsigned char* data, Py_ssize_t offset, Py_ssize_t total
+) except -1:
+    cdef Py_ssize_t signatures_len
+    cdef unsigned char first_byte
+
+    offset = _read_short_u16(data, offset, total, &signatures_len)
+    offset = _advance(offset, 64 * signatures_len, total)
+
+    if offset >= total:
+        raise ValueError("Unexpected end of buffer while decoding bytes")
+    first_byte = data[offset]
+
+    if first_byte & 0x80:
+        if (first_byte & 0x7F) != 0:
+            raise ValueError(f"Unsupported message version: {first_byte & 0x7F}")
+        return _consume_message_body(data, offset + 1, total, True)
+
+    return _consume_message_body(data, offset + 1, total, False)
+
+
+def decode_entries(bytes data not None):
+    """Split a bincode ``Vec<Entry>`` into raw components.
+
+    Returns ``(entries, consumed)`` where ``entries`` is a list of
+    ``(num_hashes, hash_bytes, [tx_bytes, ...])`` tuples and ``consumed`` is the
+    number of bytes read from ``data``.
+    """
+
+    cdef const unsigned char* buffer = data
+    cdef Py_ssize_t total = len(data)
+    cdef Py_ssize_t offset = 0
+    cdef Py_ssize_t start
+    cdef uint64_t total_entries, num_hashes, tx_count, entry_index, tx_index
+    cdef list entries = []
+    cdef list transactions
+
+    offset = _read_u64(buffer, offset, total, &total_entries)
+
+    for entry_index in range(total_entries):
+        offset = _read_u64(buffer, offset, total, &num_hashes)
+
+        start = offset
+        offset = _advance(offset, 32, total)
+        hash_bytes = data[start:offset]
+
+        offset = _read_u64(buffer, offset, total, &tx_count)
+
+        transactions = []
+        for tx_index in range(tx_count):
+            start = offset
+            offset = _consume_versioned_transaction(buffer, offset, total)
+            transactions.append(data[start:offset])
+
+        entries.append((num_hashes, hash_bytes, transactions))
+
+    return entries, offset
+
+
+def decode_entry_headers(bytes data not None):
+    """Walk a bincode ``Vec<Entry>`` and return only the entry headers.
+
+    Returns ``(headers, consumed)`` where ``headers`` is a list of
+    ``(num_hashes, hash_bytes, tx_count)`` tuples. Transactions are validated
+    and skipped without being copied.
+    """
+
+    cdef const unsigned char* buffer = data
+    cdef Py_ssize_t total = len(data)
+    cdef Py_ssize_t offset = 0
+    cdef Py_ssize_t start
+    cdef uint64_t total_entries, num_hashes, tx_count, entry_index, tx_index
+    cdef list headers = []
+
+    offset = _read_u64(buffer, offset, total, &total_entries)
+
+    for entry_index in range(total_entries):
+        offset = _read_u64(buffer, offset, total, &num_hashes)
+
+        start = offset
+        offset = _advance(offset, 32, total)
+        hash_bytes = data[start:offset]
+
+        offset = _read_u64(buffer, offset, total, &tx_count)
+        for tx_index in range(tx_count):
+            offset = _consume_versioned_transaction(buffer, offset, total)
+
+        headers.append((num_hashes, hash_bytes, tx_count))
+
+    return headers, offset
@@ -1,12 +1,22 @@
 """Helper script to generate the Python protobuf stubs for the shredstream client."""
 from __future__ import annotations
 
+import argparse
+import hashlib
+import http.client
 import sys
 import textwrap
+import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional, Sequence
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # pragma: no cover - Python <3.8
+    import importlib_metadata  # type: ignore[no-redef]
 
 try:
     import grpc_tools
@@ -23,14 +33,23 @@ REQUIRED_PROTOS: dict[Path, str] = {
     Path("shredstream.proto"): f"{RAW_BASE_URL}/protos/shredstream.proto",
     Path("shared.proto"): f"{RAW_BASE_URL}/protos/shared.proto",
 }
+STAMP_FILE_NAME = ".protos_stamp"
+# urllib applies the timeout to each blocking socket operation (connect and
+# every read), so a short value fails fast without capping slow-but-live bodies.
+DOWNLOAD_TIMEOUT_SECONDS = 10
+DOWNLOAD_ATTEMPTS = 4
+DOWNLOAD_BACKOFF_SECONDS = 0.5
+# urlopen only wraps connection errors in URLError; failures while reading the
+# response surface as OSError (e.g. ConnectionResetError) or HTTPException
+# (e.g. RemoteDisconnected, IncompleteRead).
+DOWNLOAD_ERRORS = (OSError, http.client.HTTPException)
 
 
 def _download(url: str, destination: Path) -> bool:
     request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
     try:
-        with urllib.request.urlopen(request, timeout=30) as response:  # nosec - trusted host
-            data = response.read()
-    except (urllib.error.URLError, TimeoutError) as exc:
+        data = _fetch_with_retries(request)
+    except DOWNLOAD_ERRORS as exc:
         print(
             textwrap.dedent(
                 f"""
@@ -51,6 +70,31 @@ def _download(url: str, destination: Path) -> bool:
     return True
 
 
+def _fetch(request: urllib.request.Request) -> bytes:
+    with urllib.request.urlopen(  # nosec - trusted host
+        request, timeout=DOWNLOAD_TIMEOUT_SECONDS
+    ) as response:
+        return response.read()
+
+
+def _fetch_with_retries(request: urllib.request.Request) -> bytes:
+    """Fetch ``request`` with exponential backoff on transient failures."""
+
+    for attempt in range(DOWNLOAD_ATTEMPTS - 1):
+        try:
+            return _fetch(request)
+        except DOWNLOAD_ERRORS as exc:
+            # Client errors such as 404 will not go away by retrying.
+            if isinstance(exc, urllib.error.HTTPError) and exc.code < 500:
+                raise
+
+            delay = DOWNLOAD_BACKOFF_SECONDS * 2**attempt
+            print(f"Download failed ({exc}); retrying in {delay:.1f}s …", file=sys.stderr)
+            time.sleep(delay)
+
+    return _fetch(request)
+
+
 def _ensure_protos(proto_root: Path) -> bool:
     missing: list[tuple[Path, str]] = []
     for relative_path, url in REQUIRED_PROTOS.items():
@@ -71,10 +115,12 @@ def _ensure_protos(proto_root: Path) -> bool:
                 """
             ).strip()
         )
-        if not _download(url, target):
-            return False
 
-    return True
+    # Downloads are network bound, so fetch all missing files concurrently.
+    with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+        results = list(executor.map(lambda item: _download(item[1], item[0]), missing))
+
+    return all(results)
 
 
 def _grpc_tools_include() -> Path:
@@ -103,7 +149,50 @@ def _build_args(
     return args
 
 
-def main() -> int:
+def _inputs_stamp(proto_files: Iterable[Path]) -> str:
+    """Hash the proto sources together with the grpcio-tools version."""
+
+    digest = hashlib.blake2b(digest_size=32)
+    try:
+        digest.update(importlib_metadata.version("grpcio-tools").encode())
+    except importlib_metadata.PackageNotFoundError:  # pragma: no cover - source installs
+        pass
+
+    for path in proto_files:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _outputs_exist(proto_files: Iterable[Path], output_dir: Path) -> bool:
+    return all(
+        (output_dir / f"{path.stem}{suffix}.py").exists()
+        for path in proto_files
+        for suffix in ("_pb2", "_pb2_grpc")
+    )
+
+
+def _run_protoc(
+    include_paths: Sequence[Path], proto_files: Sequence[Path], output_dir: Path, jobs: int
+) -> int:
+    """Compile ``proto_files``, one protoc process per file when ``jobs > 1``.
+
+    protoc only emits code for the files named on its command line, imports
+    are merely resolved through the include paths, so every file is an
+    independent compilation unit.
+    """
+
+    if jobs <= 1 or len(proto_files) <= 1:
+        return protoc.main(_build_args(include_paths, proto_files, output_dir))
+
+    units = [_build_args(include_paths, [path], output_dir) for path in proto_files]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(units))) as executor:
+        exit_codes = list(executor.map(protoc.main, units))
+
+    return next((code for code in exit_codes if code != 0), 0)
+
+
+def main(jobs: int = 1) -> int:
     repo_root = Path(__file__).resolve().parents[1]
     proto_root = repo_root / "jito_protos" / "protos"
     output_dir = repo_root / "python"
@@ -112,10 +201,35 @@ def main() -> int:
     if not _ensure_protos(proto_root):
         return 1
 
+    stamp = _inputs_stamp(proto_files)
+    stamp_file = output_dir / STAMP_FILE_NAME
+    try:
+        previous_stamp = stamp_file.read_text(encoding="utf-8").strip()
+    except OSError:
+        previous_stamp = None
+
+    if previous_stamp == stamp and _outputs_exist(proto_files, output_dir):
+        print("Protobuf modules are up to date; skipping protoc.")
+        return 0
+
     include_paths = [proto_root, _grpc_tools_include()]
-    args = _build_args(include_paths, proto_files, output_dir)
-    return protoc.main(args)
+    exit_code = _run_protoc(include_paths, proto_files, output_dir, jobs)
+    if exit_code == 0:
+        stamp_file.write_text(f"{stamp}\n", encoding="utf-8")
+    return exit_code
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of proto files compiled in parallel (default: 1)",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main(jobs=_parse_args().jobs))
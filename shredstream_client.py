@@ -3,15 +3,22 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urlparse
 
 import importlib
+import importlib.util
 import pkgutil
 
 try:
@@ -19,20 +26,38 @@ try:
 except ImportError:  # pragma: no cover - Python <3.8
     import importlib_metadata  # type: ignore[no-redef]
 
+# Use the C-backed upb protobuf runtime to parse slot updates unless the user
+# picked an implementation explicitly. This only takes effect if it runs before
+# the first protobuf import, hence its position above the generated modules.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 import grpc
 from grpc import aio
 
+try:
+    import based58
+except ImportError:  # pragma: no cover - optional dependency
+    based58 = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 def _ensure_local_proto_path() -> None:
     """Add the local `python/` folder to ``sys.path`` if it exists.
 
     This allows the client to pick up generated protobuf modules without
-    requiring them to be installed globally.
+    requiring them to be installed globally. Called once at import time; the
+    ``sys.path`` membership test runs before the single filesystem check.
     """
 
-    repo_python_dir = Path(__file__).resolve().parent / "python"
-    if repo_python_dir.exists() and str(repo_python_dir) not in sys.path:
-        sys.path.insert(0, str(repo_python_dir))
+    # realpath (not abspath) so the client still finds the repo when it is
+    # launched through a symlink.
+    repo_python_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "python")
+    if repo_python_dir not in sys.path and os.path.isdir(repo_python_dir):
+        sys.path.insert(0, repo_python_dir)
 
 
 _ensure_local_proto_path()
@@ -61,6 +86,16 @@ from jito_protos.shredstream import shredstream_pb2_grpc as shredstream_grpc
 from solders.pubkey import Pubkey  # noqa: E402  pylint: disable=wrong-import-position
 from solders.transaction import VersionedTransaction  # noqa: E402  pylint: disable=wrong-import-position
 
+try:  # noqa: E402  pylint: disable=wrong-import-position
+    from _entries_decode import decode_entries as _decode_entries_native
+except ImportError:  # pragma: no cover - optional Cython extension
+    _decode_entries_native = None
+
+try:  # noqa: E402  pylint: disable=wrong-import-position
+    from _entries_decode import decode_entry_headers as _decode_entry_headers_native
+except ImportError:  # pragma: no cover - optional Cython extension
+    _decode_entry_headers_native = None
+
 
 class PythonEntry:
     """Lightweight container mirroring ``solders.ledger.entry.Entry``."""
@@ -70,7 +105,9 @@ class PythonEntry:
     def __init__(self, num_hashes: int, hash_bytes: bytes, transactions: Sequence[VersionedTransaction]):
         self.num_hashes = num_hashes
         self.hash = hash_bytes
-        self.transactions = tuple(transactions)
+        # Like ``solders``' ``Entry.transactions``, keep a list; decoders hand
+        # over freshly built lists, so those are stored without copying.
+        self.transactions = transactions if isinstance(transactions, list) else list(transactions)
 
     def __iter__(self) -> Iterator[VersionedTransaction]:
         return iter(self.transactions)
@@ -85,34 +122,81 @@ class PythonEntries(Sequence[PythonEntry]):
     __slots__ = ("_entries",)
 
     def __init__(self, entries: Sequence[PythonEntry]):
-        self._entries = tuple(entries)
+        self._entries = entries if isinstance(entries, list) else list(entries)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "PythonEntries":
-        buffer = memoryview(data)
+        if _decode_entries_native is not None:
+            return cls._from_native(bytes(data))
+
+        data = bytes(data)
+        offset = 0
+
+        total_entries, offset = _read_u64(data, offset)
+        _check_count(total_entries, MIN_ENTRY_SIZE, data, offset)
+        entries: List[Optional[PythonEntry]] = [None] * total_entries
+
+        for entry_index in range(total_entries):
+            num_hashes, offset = _read_u64(data, offset)
+            hash_bytes, offset = _read_bytes(data, offset, 32)
+            tx_count, offset = _read_u64(data, offset)
+            _check_count(tx_count, MIN_TRANSACTION_SIZE, data, offset)
+
+            transactions: List[Optional[VersionedTransaction]] = [None] * tx_count
+            for tx_index in range(tx_count):
+                tx_bytes, offset = _consume_versioned_transaction(data, offset)
+                transactions[tx_index] = VersionedTransaction.from_bytes(tx_bytes)
+
+            entries[entry_index] = PythonEntry(num_hashes, hash_bytes, transactions)
+
+        _log_trailing_bytes(len(data) - offset)
+        return cls(entries)
+
+    @staticmethod
+    def iter_headers(data: bytes) -> Iterator[Tuple[int, bytes, int]]:
+        """Yield ``(num_hashes, hash_bytes, tx_count)`` for every entry in ``data``.
+
+        Fast path for monitoring consumers that only count entries or
+        transactions: transactions are validated and skipped, never copied or
+        deserialized. Uses the Cython extension when it is available.
+        """
+
+        if _decode_entry_headers_native is not None:
+            headers, offset = _decode_entry_headers_native(bytes(data))
+            yield from headers
+            _log_trailing_bytes(len(data) - offset)
+            return
+
+        data = bytes(data)
         offset = 0
 
-        total_entries, offset = _read_u64(buffer, offset)
-        entries: List[PythonEntry] = []
+        total_entries, offset = _read_u64(data, offset)
 
         for _ in range(total_entries):
-            num_hashes, offset = _read_u64(buffer, offset)
-            hash_bytes, offset = _read_bytes(buffer, offset, 32)
-            tx_count, offset = _read_u64(buffer, offset)
+            num_hashes, offset = _read_u64(data, offset)
+            hash_bytes, offset = _read_bytes(data, offset, 32)
+            tx_count, offset = _read_u64(data, offset)
 
-            transactions: List[VersionedTransaction] = []
             for _ in range(tx_count):
-                tx_bytes, offset = _consume_versioned_transaction(buffer, offset)
-                transactions.append(VersionedTransaction.from_bytes(tx_bytes))
+                offset = _skip_versioned_transaction(data, offset)
 
-            entries.append(PythonEntry(num_hashes, bytes(hash_bytes), transactions))
+            yield num_hashes, hash_bytes, tx_count
 
-        remaining = len(buffer) - offset
-        if remaining:
-            LOGGER.debug(
-                "Ignoring %d trailing byte(s) after decoding ledger entries", remaining
+        _log_trailing_bytes(len(data) - offset)
+
+    @classmethod
+    def _from_native(cls, data: bytes) -> "PythonEntries":
+        raw_entries, offset = _decode_entries_native(data)
+        entries = [
+            PythonEntry(
+                num_hashes,
+                hash_bytes,
+                [VersionedTransaction.from_bytes(tx_bytes) for tx_bytes in raw_transactions],
             )
+            for num_hashes, hash_bytes, raw_transactions in raw_entries
+        ]
 
+        _log_trailing_bytes(len(data) - offset)
         return cls(entries)
 
     def __iter__(self) -> Iterator[PythonEntry]:
@@ -125,112 +209,222 @@ class PythonEntries(Sequence[PythonEntry]):
         return self._entries[index]
 
 
+def iter_entries(
+    data: bytes, filter_accounts: Optional[FrozenSet[bytes]] = None
+) -> Iterator[Tuple[int, bytes, Iterator[VersionedTransaction]]]:
+    """Lazily decode ledger entries from ``data``.
+
+    Yields ``(num_hashes, hash_bytes, transactions)`` tuples where
+    ``transactions`` is a generator that deserializes each transaction on
+    demand. Transactions left unconsumed when the next entry is requested are
+    skipped without being deserialized. When ``filter_accounts`` is given,
+    transactions whose static account keys contain none of the raw 32-byte keys
+    are rejected from the serialized bytes, before ``VersionedTransaction`` is
+    built.
+    """
+
+    if _decode_entries_native is not None:
+        raw_entries, offset = _decode_entries_native(bytes(data))
+        for num_hashes, hash_bytes, raw_transactions in raw_entries:
+            yield num_hashes, hash_bytes, _deserialize_transactions(raw_transactions, filter_accounts)
+
+        _log_trailing_bytes(len(data) - offset)
+        return
+
+    data = bytes(data)
+    offset = 0
+
+    total_entries, offset = _read_u64(data, offset)
+
+    for _ in range(total_entries):
+        num_hashes, offset = _read_u64(data, offset)
+        hash_bytes, offset = _read_bytes(data, offset, 32)
+        tx_count, offset = _read_u64(data, offset)
+
+        cursor = _TransactionCursor(offset, tx_count)
+        yield num_hashes, hash_bytes, _deserialize_transactions(
+            _iter_transaction_bytes(data, cursor), filter_accounts
+        )
+
+        offset = cursor.offset
+        for _ in range(cursor.remaining):
+            offset = _skip_versioned_transaction(data, offset)
+
+    _log_trailing_bytes(len(data) - offset)
+
+
+class _TransactionCursor:
+    """Read position shared between ``iter_entries`` and its transaction generator."""
+
+    __slots__ = ("offset", "remaining")
+
+    def __init__(self, offset: int, remaining: int):
+        self.offset = offset
+        self.remaining = remaining
+
+
+def _iter_transaction_bytes(data: bytes, cursor: _TransactionCursor) -> Iterator[bytes]:
+    while cursor.remaining:
+        tx_bytes, cursor.offset = _consume_versioned_transaction(data, cursor.offset)
+        cursor.remaining -= 1
+        yield tx_bytes
+
+
+def _deserialize_transactions(
+    raw_transactions: Iterable[bytes], filter_accounts: Optional[FrozenSet[bytes]]
+) -> Iterator[VersionedTransaction]:
+    for tx_bytes in raw_transactions:
+        if filter_accounts and not _static_account_keys_match(tx_bytes, filter_accounts):
+            continue
+        yield VersionedTransaction.from_bytes(tx_bytes)
+
+
+def _static_account_keys_match(tx_bytes: bytes, filter_accounts: FrozenSet[bytes]) -> bool:
+    """Check the serialized static account keys of an already validated transaction."""
+
+    signatures_len, offset = _read_short_u16(tx_bytes, 0)
+    offset += 64 * signatures_len
+
+    # Legacy messages start with the 3-byte header, v0 messages add a version prefix.
+    offset += 4 if tx_bytes[offset] & 0x80 else 3
+
+    account_keys_len, offset = _read_short_u16(tx_bytes, offset)
+    end = offset + 32 * account_keys_len
+
+    return not filter_accounts.isdisjoint(
+        tx_bytes[start:start + 32] for start in range(offset, end, 32)
+    )
+
+
 Entries = None
 
 
-def _read_u64(buffer: memoryview, offset: int) -> tuple[int, int]:
-    slice_view = _slice_bytes(buffer, offset, 8)
+def _log_trailing_bytes(remaining: int) -> None:
+    if remaining:
+        LOGGER.debug(
+            "Ignoring %d trailing byte(s) after decoding ledger entries", remaining
+        )
+
+
+# Smallest serialized entry: num_hashes, hash and the transaction count.
+MIN_ENTRY_SIZE = 8 + 32 + 8
+# Smallest serialized transaction: an empty signature vector followed by a
+# legacy message without account keys or instructions.
+MIN_TRANSACTION_SIZE = 1 + 3 + 1 + 32 + 1
+
+
+def _check_count(count: int, min_size: int, data: bytes, offset: int) -> None:
+    """Reject counts that cannot fit in the rest of ``data`` before preallocating."""
+
+    if count * min_size > len(data) - offset:
+        raise ValueError("Unexpected end of buffer while decoding data")
+
+
+def _read_u64(data: bytes, offset: int) -> tuple[int, int]:
+    slice_view = _slice_bytes(data, offset, 8)
     return int.from_bytes(slice_view, "little"), offset + 8
 
 
-def _read_u8(buffer: memoryview, offset: int) -> tuple[int, int]:
-    slice_view = _slice_bytes(buffer, offset, 1)
-    return slice_view[0], offset + 1
+def _read_u8(data: bytes, offset: int) -> tuple[int, int]:
+    if offset >= len(data):
+        raise ValueError("Unexpected end of buffer while decoding bytes")
+    return data[offset], offset + 1
 
 
-def _read_bytes(buffer: memoryview, offset: int, length: int) -> tuple[memoryview, int]:
-    return _slice_bytes(buffer, offset, length), offset + length
+def _read_bytes(data: bytes, offset: int, length: int) -> tuple[bytes, int]:
+    return _slice_bytes(data, offset, length), offset + length
 
 
-def _slice_bytes(buffer: memoryview, offset: int, length: int) -> memoryview:
+def _slice_bytes(data: bytes, offset: int, length: int) -> bytes:
     end = offset + length
-    if end > len(buffer):
+    if end > len(data):
         raise ValueError("Unexpected end of buffer while decoding bytes")
-    return buffer[offset:end]
+    return data[offset:end]
 
 
-def _consume_versioned_transaction(buffer: memoryview, offset: int) -> tuple[bytes, int]:
-    start = offset
+def _consume_versioned_transaction(data: bytes, offset: int) -> tuple[bytes, int]:
+    end = _skip_versioned_transaction(data, offset)
+    return data[offset:end], end
 
-    signatures_len, offset = _read_short_u16(buffer, offset)
-    offset = _advance(offset, 64 * signatures_len, len(buffer))
 
-    offset = _consume_versioned_message(buffer, offset)
+def _skip_versioned_transaction(data: bytes, offset: int) -> int:
+    signatures_len, offset = _read_short_u16(data, offset)
+    offset = _advance(offset, 64 * signatures_len, len(data))
 
-    return bytes(buffer[start:offset]), offset
+    return _consume_versioned_message(data, offset)
 
 
-def _consume_versioned_message(buffer: memoryview, offset: int) -> int:
-    first_byte, offset = _read_u8(buffer, offset)
+def _consume_versioned_message(data: bytes, offset: int) -> int:
+    first_byte, offset = _read_u8(data, offset)
 
     if first_byte & 0x80:
         version = first_byte & 0x7F
         if version != 0:
             raise ValueError(f"Unsupported message version: {version}")
-        return _consume_message_v0(buffer, offset)
+        return _consume_message_v0(data, offset)
 
-    return _consume_message_legacy(buffer, offset)
+    return _consume_message_legacy(data, offset)
 
 
-def _consume_message_legacy(buffer: memoryview, offset: int) -> int:
+def _consume_message_legacy(data: bytes, offset: int) -> int:
     # remaining header bytes
-    offset = _advance(offset, 2, len(buffer))
+    offset = _advance(offset, 2, len(data))
 
-    account_keys_len, offset = _read_short_u16(buffer, offset)
-    offset = _advance(offset, 32 * account_keys_len, len(buffer))
+    account_keys_len, offset = _read_short_u16(data, offset)
+    offset = _advance(offset, 32 * account_keys_len, len(data))
 
-    offset = _advance(offset, 32, len(buffer))  # recent_blockhash
+    offset = _advance(offset, 32, len(data))  # recent_blockhash
 
-    instructions_len, offset = _read_short_u16(buffer, offset)
+    instructions_len, offset = _read_short_u16(data, offset)
     for _ in range(instructions_len):
-        offset = _consume_compiled_instruction(buffer, offset)
+        offset = _consume_compiled_instruction(data, offset)
 
     return offset
 
 
-def _consume_message_v0(buffer: memoryview, offset: int) -> int:
-    offset = _advance(offset, 3, len(buffer))  # message header
+def _consume_message_v0(data: bytes, offset: int) -> int:
+    offset = _advance(offset, 3, len(data))  # message header
 
-    account_keys_len, offset = _read_short_u16(buffer, offset)
-    offset = _advance(offset, 32 * account_keys_len, len(buffer))
+    account_keys_len, offset = _read_short_u16(data, offset)
+    offset = _advance(offset, 32 * account_keys_len, len(data))
 
-    offset = _advance(offset, 32, len(buffer))  # recent_blockhash
+    offset = _advance(offset, 32, len(data))  # recent_blockhash
 
-    instructions_len, offset = _read_short_u16(buffer, offset)
+    instructions_len, offset = _read_short_u16(data, offset)
     for _ in range(instructions_len):
-        offset = _consume_compiled_instruction(buffer, offset)
+        offset = _consume_compiled_instruction(data, offset)
 
-    lookups_len, offset = _read_short_u16(buffer, offset)
+    lookups_len, offset = _read_short_u16(data, offset)
     for _ in range(lookups_len):
-        offset = _advance(offset, 32, len(buffer))  # account_key
+        offset = _advance(offset, 32, len(data))  # account_key
 
-        writable_len, offset = _read_short_u16(buffer, offset)
-        offset = _advance(offset, writable_len, len(buffer))
+        writable_len, offset = _read_short_u16(data, offset)
+        offset = _advance(offset, writable_len, len(data))
 
-        readonly_len, offset = _read_short_u16(buffer, offset)
-        offset = _advance(offset, readonly_len, len(buffer))
+        readonly_len, offset = _read_short_u16(data, offset)
+        offset = _advance(offset, readonly_len, len(data))
 
     return offset
 
 
-def _consume_compiled_instruction(buffer: memoryview, offset: int) -> int:
-    offset = _advance(offset, 1, len(buffer))  # program_id_index
+def _consume_compiled_instruction(data: bytes, offset: int) -> int:
+    offset = _advance(offset, 1, len(data))  # program_id_index
 
-    accounts_len, offset = _read_short_u16(buffer, offset)
-    offset = _advance(offset, accounts_len, len(buffer))
+    accounts_len, offset = _read_short_u16(data, offset)
+    offset = _advance(offset, accounts_len, len(data))
 
-    data_len, offset = _read_short_u16(buffer, offset)
-    offset = _advance(offset, data_len, len(buffer))
+    data_len, offset = _read_short_u16(data, offset)
+    offset = _advance(offset, data_len, len(data))
 
     return offset
 
 
-def _read_short_u16(buffer: memoryview, offset: int) -> tuple[int, int]:
+def _read_short_u16(data: bytes, offset: int) -> tuple[int, int]:
     value = 0
     shift = 0
 
     for _ in range(3):
-        byte, offset = _read_u8(buffer, offset)
+        byte, offset = _read_u8(data, offset)
         value |= (byte & 0x7F) << shift
 
         if byte & 0x80 == 0:
@@ -251,6 +445,14 @@ def _advance(offset: int, length: int, total: int) -> int:
 
 
 def _import_entries_from(module_name: str) -> Optional[type]:
+    # Probe with find_spec first: a missing candidate is rejected from the
+    # import system's finders without raising through a full import attempt.
+    try:
+        if importlib.util.find_spec(module_name) is None:
+            return None
+    except (ModuleNotFoundError, ValueError):
+        return None
+
     try:
         module = importlib.import_module(module_name)
     except ModuleNotFoundError:
@@ -259,6 +461,15 @@ def _import_entries_from(module_name: str) -> Optional[type]:
     return getattr(module, "Entries", None)
 
 
+def _first_entries_type(module_names: Iterable[str]) -> Tuple[Optional[str], Optional[type]]:
+    for module_name in sorted(module_names):
+        entries_type = _import_entries_from(module_name)
+        if entries_type is not None:
+            return module_name, entries_type
+
+    return None, None
+
+
 def _discover_solders_modules() -> Set[str]:  # pragma: no cover - import side effect wrapper
     modules: Set[str] = set()
 
@@ -297,8 +508,83 @@ def _discover_solders_modules() -> Set[str]:  # pragma: no cover - import side e
     return modules
 
 
+def _entries_module_cache_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "shredstream-decode" / "entries_module.json"
+
+
+def _solders_fingerprint() -> Optional[str]:
+    """Identify the installed ``solders`` build, not just its version.
+
+    Rebuilding ``solders`` with the ``ledger`` feature usually keeps the version
+    number, but reinstalling rewrites the dist's ``RECORD``, which lists the
+    hash of every installed file including the compiled extension. Returns
+    ``None``, disabling the cache, when ``RECORD`` is unavailable.
+    """
+
+    try:
+        distribution = importlib_metadata.distribution("solders")
+        record = distribution.read_text("RECORD")
+    except Exception:  # pragma: no cover - metadata lookup is best effort
+        return None
+
+    if record is None:
+        return None
+
+    record_hash = hashlib.blake2b(record.encode(), digest_size=16).hexdigest()
+    return f"{distribution.version}:{record_hash}"
+
+
+def _read_entries_module_cache(solders_fingerprint: str) -> Tuple[bool, Optional[str]]:
+    """Return ``(hit, module_name)`` for the cached lookup of ``solders_fingerprint``.
+
+    A hit with ``module_name`` set to ``None`` records that the wheel does not
+    expose ``Entries`` at all.
+    """
+
+    try:
+        cached = json.loads(_entries_module_cache_path().read_text(encoding="utf-8"))
+    except (OSError, RuntimeError, ValueError):
+        return False, None
+
+    if not isinstance(cached, dict) or cached.get("solders_fingerprint") != solders_fingerprint:
+        return False, None
+
+    module_name = cached.get("module")
+    return True, module_name if isinstance(module_name, str) else None
+
+
+def _write_entries_module_cache(solders_fingerprint: str, module_name: Optional[str]) -> None:
+    try:
+        cache_path = _entries_module_cache_path()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"solders_fingerprint": solders_fingerprint, "module": module_name}),
+            encoding="utf-8",
+        )
+    except (OSError, RuntimeError) as exc:  # pragma: no cover - cache is best effort
+        LOGGER.debug("Could not write the Entries module cache: %s", exc)
+
+
+@functools.lru_cache(maxsize=1)
 def _load_entries_type() -> type:  # pragma: no cover - import side effect wrapper
-    """Load the ``Entries`` helper from the installed ``solders`` wheel."""
+    """Load the ``Entries`` helper from the installed ``solders`` wheel.
+
+    The outcome of the module search is cached on disk per installed
+    ``solders`` build (see ``_solders_fingerprint``), so later startups skip the
+    package walk entirely.
+    """
+
+    solders_fingerprint = _solders_fingerprint()
+    if solders_fingerprint is not None:
+        hit, cached_module = _read_entries_module_cache(solders_fingerprint)
+        if hit and cached_module is None:
+            raise ImportError("The installed `solders` wheel does not expose the `Entries` helper.")
+        if hit:
+            entries_type = _import_entries_from(cached_module)
+            if entries_type is not None:
+                logging.debug("Loaded Entries helper from cached module %s", cached_module)
+                return entries_type
 
     candidate_modules = {
         "solders.entry",
@@ -308,19 +594,27 @@ def _load_entries_type() -> type:  # pragma: no cover - import side effect wrapp
         "solders.ledger.entry_pb2",
     }
 
-    try:
-        candidate_modules.update(_discover_solders_modules())
-    except ImportError:
-        raise
-    except Exception:  # pragma: no cover - discovery is best effort
-        pass
-
-    for module_name in sorted(candidate_modules):
-        entries_type = _import_entries_from(module_name)
-        if entries_type is not None:
-            logging.debug("Loaded Entries helper from %s", module_name)
-            return entries_type
+    module_name, entries_type = _first_entries_type(candidate_modules)
 
+    if entries_type is None:
+        # Only walk the package when none of the well-known locations work.
+        try:
+            discovered_modules = _discover_solders_modules()
+        except ImportError:
+            raise
+        except Exception:  # pragma: no cover - discovery is best effort
+            discovered_modules = set()
+
+        module_name, entries_type = _first_entries_type(discovered_modules - candidate_modules)
+
+    if entries_type is not None:
+        logging.debug("Loaded Entries helper from %s", module_name)
+        if solders_fingerprint is not None:
+            _write_entries_module_cache(solders_fingerprint, module_name)
+        return entries_type
+
+    if solders_fingerprint is not None:
+        _write_entries_module_cache(solders_fingerprint, None)
     raise ImportError("The installed `solders` wheel does not expose the `Entries` helper.")
 
 
@@ -344,7 +638,31 @@ KEEPALIVE_OPTIONS: Sequence[tuple[str, int]] = (
     ("grpc.keepalive_permit_without_calls", 1),
     ("grpc.tcp_keepalive_time_ms", 15_000),
     ("grpc.client_idle_timeout_ms", 0),
+    # Give every channel its own subchannel (and TCP connection) so that
+    # parallel streams do not share a single HTTP/2 connection.
+    ("grpc.use_local_subchannel_pool", 1),
+)
+
+# Ledger decoding runs off the event loop so that receiving the next gRPC
+# message overlaps with parsing the previous one.
+DECODE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="entries-decode"
 )
+DECODE_QUEUE_SIZE = 256
+# Number of recent slot updates remembered to drop duplicates across streams.
+DEDUP_WINDOW = 4096
+
+OUTPUT_FORMATS = ("repr", "json", "none")
+
+# Each key costs one full substring scan of the slot payload, so the raw-bytes
+# pre-filter only pays off for small filter sets.
+SLOT_PREFILTER_MAX_KEYS = 8
+
+# Decode failures are logged at most once per interval so that a burst of
+# corrupt frames cannot stall the event loop with traceback formatting.
+DECODE_ERROR_LOG_INTERVAL = 1.0
+_last_decode_error_log = float("-inf")
+_suppressed_decode_errors = 0
 
 
 def _normalize_endpoint(raw_endpoint: str) -> Tuple[str, Optional[grpc.ChannelCredentials]]:
@@ -380,13 +698,72 @@ def _normalize_endpoint(raw_endpoint: str) -> Tuple[str, Optional[grpc.ChannelCr
 async def stream_entries(
     endpoint: str,
     x_token: Optional[str],
-    filter_accounts: Optional[Set[Pubkey]],
+    filter_accounts: Optional[FrozenSet[bytes]],
+    decode_workers: int = 1,
+    streams: int = 1,
+    output_format: str = "repr",
 ) -> None:
-    """Connect to the shredstream proxy and print filtered transactions."""
+    """Connect to the shredstream proxy and print filtered transactions.
+
+    With ``streams`` greater than one, each subscription runs on its own
+    channel and the first copy of every slot update wins; later copies are
+    dropped before decoding.
+    """
     metadata: Sequence[tuple[str, str]] = (("x-token", x_token),) if x_token else ()
 
     target, credentials = _normalize_endpoint(endpoint)
 
+    streams = max(1, streams)
+    seen = _RecentUpdates(DEDUP_WINDOW) if streams > 1 else None
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=DECODE_QUEUE_SIZE)
+    workers = [
+        asyncio.create_task(_decode_worker(queue, filter_accounts, output_format))
+        for _ in range(max(1, decode_workers))
+    ]
+    receivers = [
+        asyncio.create_task(_receive_entries(target, credentials, metadata, queue, seen))
+        for _ in range(streams)
+    ]
+
+    drained = None
+    try:
+        await _wait_for_tasks(receivers, workers)
+
+        drained = asyncio.create_task(queue.join())
+        await _wait_for_tasks([drained], workers)
+    finally:
+        tasks = (*receivers, *workers) + ((drained,) if drained is not None else ())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        _report_suppressed_decode_errors(force=True)
+
+
+async def _wait_for_tasks(tasks: Sequence[asyncio.Task], watched: Sequence[asyncio.Task]) -> None:
+    """Wait until all ``tasks`` finish, re-raising the first failure among either group.
+
+    Decode workers never return on their own, so a finished worker means it
+    died; watching them keeps a dead consumer from leaving the receivers
+    blocked on a full queue forever.
+    """
+
+    pending = {*tasks, *watched}
+    while any(not task.done() for task in tasks):
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
+
+
+async def _receive_entries(
+    target: str,
+    credentials: Optional[grpc.ChannelCredentials],
+    metadata: Sequence[tuple[str, str]],
+    queue: asyncio.Queue,
+    seen: Optional["_RecentUpdates"],
+) -> None:
+    """Subscribe to the proxy on a dedicated channel and enqueue slot updates."""
+
     channel_factory = (
         aio.secure_channel if credentials is not None else aio.insecure_channel
     )
@@ -402,31 +779,207 @@ async def stream_entries(
         stream = client.SubscribeEntries(request, metadata=metadata)
 
         async for slot_entry in stream:
+            if seen is None or seen.add((slot_entry.slot, hash(slot_entry.entries))):
+                await queue.put(slot_entry)
+
+
+class _RecentUpdates:
+    """Bounded set of recently received slot updates."""
+
+    __slots__ = ("_keys", "_order")
+
+    def __init__(self, capacity: int):
+        self._keys: Set[Tuple[int, int]] = set()
+        self._order: deque = deque(maxlen=capacity)
+
+    def add(self, key: Tuple[int, int]) -> bool:
+        """Remember ``key`` and return ``False`` if it was already seen."""
+
+        if key in self._keys:
+            return False
+
+        if len(self._order) == self._order.maxlen:
+            self._keys.discard(self._order[0])
+        self._order.append(key)
+        self._keys.add(key)
+        return True
+
+
+async def _decode_worker(
+    queue: asyncio.Queue,
+    filter_accounts: Optional[FrozenSet[bytes]],
+    output_format: str,
+) -> None:
+    """Decode queued slot updates on ``DECODE_EXECUTOR`` and print the matches."""
+
+    loop = asyncio.get_running_loop()
+
+    while True:
+        slot_entry = await queue.get()
+        try:
             try:
-                entries = Entries.from_bytes(slot_entry.entries)
+                output = await loop.run_in_executor(
+                    DECODE_EXECUTOR,
+                    _decode_and_render,
+                    slot_entry.slot,
+                    slot_entry.entries,
+                    filter_accounts,
+                    output_format,
+                )
             except Exception as exc:  # pylint: disable=broad-except
-                logging.exception("Failed to decode entries from slot %s: %s", slot_entry.slot, exc)
+                _log_decode_error(slot_entry.slot, exc)
                 continue
 
-            for entry in entries:
-                for transaction in entry.transactions:
-                    if _should_print_transaction(transaction, filter_accounts):
-                        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                        print(f"[{timestamp}] Transaction: {transaction}\n")
+            _report_suppressed_decode_errors()
+            if output:
+                _write_output(output)
+        finally:
+            queue.task_done()
+
+
+def _log_decode_error(slot: int, exc: Exception) -> None:
+    """Log a decode failure, rate limited to one record per interval.
+
+    The full traceback is only attached when debug logging is enabled.
+    """
+
+    global _last_decode_error_log, _suppressed_decode_errors  # pylint: disable=global-statement
+
+    now = time.monotonic()
+    if now - _last_decode_error_log < DECODE_ERROR_LOG_INTERVAL:
+        _suppressed_decode_errors += 1
+        return
 
+    _report_suppressed_decode_errors()
+    _last_decode_error_log = now
 
-def _should_print_transaction(transaction, filter_accounts: Optional[Set[Pubkey]]) -> bool:
+    logging.error(
+        "Failed to decode entries from slot %s: %s",
+        slot,
+        exc,
+        exc_info=exc if logging.getLogger().isEnabledFor(logging.DEBUG) else None,
+    )
+
+
+def _report_suppressed_decode_errors(force: bool = False) -> None:
+    """Log the number of decode errors swallowed by the rate limit.
+
+    Unless ``force`` is set, the summary waits until the current interval has
+    ended, so a burst that stops is still reported once it is over.
+    """
+
+    global _suppressed_decode_errors  # pylint: disable=global-statement
+
+    if not _suppressed_decode_errors:
+        return
+    if not force and time.monotonic() - _last_decode_error_log < DECODE_ERROR_LOG_INTERVAL:
+        return
+
+    logging.warning(
+        "Suppressed %d further decode error(s) since the last report",
+        _suppressed_decode_errors,
+    )
+    _suppressed_decode_errors = 0
+
+
+def _decode_and_render(
+    slot: int,
+    data: bytes,
+    filter_accounts: Optional[FrozenSet[bytes]],
+    output_format: str,
+) -> bytes:
+    transactions = _decode_matching_transactions(data, filter_accounts)
+    return _render_transactions(slot, transactions, output_format)
+
+
+def _render_transactions(
+    slot: int, transactions: Sequence[VersionedTransaction], output_format: str
+) -> bytes:
+    """Format a slot's matching transactions as a single output chunk."""
+
+    if output_format == "none" or not transactions:
+        return b""
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+    if output_format == "json":
+        return b"".join(
+            _dump_json(
+                {"timestamp": timestamp, "slot": slot, "signature": str(transaction.signatures[0])}
+            )
+            + b"\n"
+            for transaction in transactions
+        )
+
+    return "".join(
+        f"[{timestamp}] Transaction: {transaction}\n\n" for transaction in transactions
+    ).encode()
+
+
+def _dump_json(record: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, separators=(",", ":")).encode()
+
+
+def _write_output(output: bytes) -> None:
+    """Write one rendered slot to stdout with a single write and flush."""
+
+    stdout = sys.stdout
+    binary_stdout = getattr(stdout, "buffer", None)
+    if binary_stdout is None:  # pragma: no cover - stdout replaced by a text stream
+        stdout.write(output.decode())
+        stdout.flush()
+        return
+
+    binary_stdout.write(output)
+    binary_stdout.flush()
+
+
+def _decode_matching_transactions(
+    data: bytes, filter_accounts: Optional[FrozenSet[bytes]]
+) -> List[VersionedTransaction]:
+    """Decode ``data`` and return only the transactions that pass the filter."""
+
+    if (
+        filter_accounts
+        and len(filter_accounts) <= SLOT_PREFILTER_MAX_KEYS
+        and not any(key in data for key in filter_accounts)
+    ):
+        # Pubkeys are stored verbatim, so no transaction in this slot can match.
+        return []
+
+    if Entries is PythonEntries:
+        # The lazy decoder applies the filter before deserializing transactions.
+        return [
+            transaction
+            for _, _, transactions in iter_entries(data, filter_accounts)
+            for transaction in transactions
+        ]
+
+    return [
+        transaction
+        for entry in Entries.from_bytes(data)
+        for transaction in entry.transactions
+        if _should_print_transaction(transaction, filter_accounts)
+    ]
+
+
+def _should_print_transaction(transaction, filter_accounts: Optional[FrozenSet[bytes]]) -> bool:
     if not filter_accounts:
         return True
 
     message = transaction.message
     try:
-        account_keys: Iterable[Pubkey] = message.static_account_keys()
+        static_account_keys = message.static_account_keys
     except AttributeError:
         # Older versions of solders expose `account_keys` instead of `static_account_keys`.
-        account_keys = message.account_keys
+        account_keys: Iterable[Pubkey] = message.account_keys
+    else:
+        account_keys = static_account_keys()
 
-    return any(key in filter_accounts for key in account_keys)
+    # map() keeps the per-key conversion in C; isdisjoint stops at the first hit.
+    return not filter_accounts.isdisjoint(map(bytes, account_keys))
 
 
 BASE58_ALPHABET = frozenset("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
@@ -463,21 +1016,42 @@ def _pubkey_error_hint(raw_value: str) -> str:
     return " ".join(hints)
 
 
-def parse_pubkeys(values: Optional[Sequence[str]]) -> Optional[Set[Pubkey]]:
+def _decode_pubkey(value: str) -> bytes:
+    """Decode a base58 pubkey into its raw 32 bytes, raising ``ValueError`` if invalid."""
+
+    if based58 is None:
+        return bytes(Pubkey.from_string(value))
+
+    decoded = based58.b58decode(value.encode())
+    if len(decoded) != 32:
+        raise ValueError(f"expected 32 bytes, decoded {len(decoded)}")
+    return decoded
+
+
+def parse_pubkeys(values: Optional[Sequence[str]]) -> Optional[FrozenSet[bytes]]:
+    """Parse base58 pubkeys into a set of raw 32-byte keys for fast lookups."""
+
     if not values:
         return None
 
-    parsed: Set[Pubkey] = set()
-    for value in values:
+    parsed: Set[bytes] = set()
+    errors: List[str] = []
+
+    # Decode every distinct value once and report all invalid keys together,
+    # instead of stopping at the first one in a long filter list.
+    for value in dict.fromkeys(values):
         try:
-            parsed.add(Pubkey.from_string(value))
-        except ValueError as exc:
+            parsed.add(_decode_pubkey(value))
+        except ValueError:
             hint = _pubkey_error_hint(value)
             message = f"Invalid pubkey provided: {value}."
             if hint:
                 message += f" {hint}"
-            raise SystemExit(message) from exc
-    return parsed
+            errors.append(message)
+
+    if errors:
+        raise SystemExit("\n".join(errors))
+    return frozenset(parsed)
 
 
 async def run_forever(args: argparse.Namespace) -> None:
@@ -485,7 +1059,14 @@ async def run_forever(args: argparse.Namespace) -> None:
 
     while True:
         try:
-            await stream_entries(args.shredstream_uri, args.x_token, filter_accounts)
+            await stream_entries(
+                args.shredstream_uri,
+                args.x_token,
+                filter_accounts,
+                decode_workers=args.decode_workers,
+                streams=args.streams,
+                output_format=args.output_format,
+            )
             logging.info("Stream ended gracefully. Reconnecting…")
         except ValueError as exc:
             raise SystemExit(str(exc)) from exc
@@ -512,6 +1093,34 @@ def main() -> None:
         nargs="+",
         help="Filter transactions to only those touching the provided accounts",
     )
+    parser.add_argument(
+        "--decode-workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of slot updates decoded concurrently on the thread pool. "
+            "Values above 1 may print slots out of order"
+        ),
+    )
+    parser.add_argument(
+        "--streams",
+        type=int,
+        default=1,
+        help=(
+            "Number of parallel subscriptions, each on its own connection. "
+            "Duplicate slot updates are dropped, so the fastest copy wins"
+        ),
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="repr",
+        help=(
+            "How matching transactions are printed: the full transaction (repr), "
+            "one compact JSON object per line (json) or nothing (none, useful to "
+            "benchmark decoding)"
+        ),
+    )
 
     args = parser.parse_args()
 